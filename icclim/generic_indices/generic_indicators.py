@@ -3,12 +3,11 @@ from __future__ import annotations
 import abc
 from abc import ABC
 from datetime import timedelta
-from functools import partial, reduce
+from functools import lru_cache
 from typing import Any, Callable
 from warnings import warn
 
 import jinja2
-import numpy
 import numpy as np
 import xarray as xr
 from jinja2 import Environment
@@ -46,6 +45,16 @@ from icclim.models.operator import OperatorRegistry
 from icclim.models.registry import Registry
 
 jinja_env = Environment()
+# Process-constant names are registered once as environment globals instead of
+# being re-added to the scope of every render.
+jinja_env.globals.update(np=np, enumerate=enumerate, len=len)
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template_source: str) -> jinja2.Template:
+    # Compiled templates are memoized because indicators re-render the same
+    # few template strings on every call.
+    return jinja_env.from_string(template_source)
 
 
 class MissingMethodLike(metaclass=abc.ABCMeta):
@@ -94,6 +103,9 @@ class ResamplingIndicator(Indicator, ABC):
     def __init__(self, missing="from_context", missing_options=None):
         self.missing_options = missing_options
         self.missing = missing
+        # Rendered metadata is kept separately so that the templated properties
+        # are never overwritten and the indicator stays reusable across calls.
+        self._rendered_properties: dict[str, str] = {}
         if self.missing == "from_context" and self.missing_options is not None:
             raise ValueError(
                 "Cannot set `missing_options` with `missing` method being from context."
@@ -129,9 +141,7 @@ class ResamplingIndicator(Indicator, ABC):
         if self.missing != "skip" and indexer is not None:
             # reference variable is a subset of the studied variable,
             # so no need to check it.
-            das = filter(lambda cv: not cv.is_reference, climate_vars)
-            das = map(lambda cv: cv.studied_data, das)
-            das = list(das)
+            das = [cv.studied_data for cv in climate_vars if not cv.is_reference]
             if "time" in result.dims:
                 result = self._handle_missing_values(
                     resample_freq=output_freq,
@@ -140,18 +150,16 @@ class ResamplingIndicator(Indicator, ABC):
                     in_data=das,
                     out_data=result,
                 )
-        for prop in self.templated_properties:
-            result.attrs[prop] = getattr(self, prop)
-        result.attrs["history"] = ""
+        result.attrs.update(self._rendered_properties, history="")
         return result
 
     def format(self, jinja_scope: dict):
-        for templated_property in self.templated_properties:
-            template = jinja_env.from_string(
-                getattr(self, templated_property),
-                globals=jinja_scope,
-            )
-            setattr(self, templated_property, template.render())
+        self._rendered_properties = {
+            templated_property: _compile_template(
+                getattr(self, templated_property)
+            ).render(**jinja_scope)
+            for templated_property in self.templated_properties
+        }
 
     def _handle_missing_values(
         self,
@@ -165,15 +173,19 @@ class ResamplingIndicator(Indicator, ABC):
         # We flag periods according to the missing method. skip variables without a time
         # coordinate.
         missing_method: MissingMethodLike = MISSING_METHODS[self.missing]  # noqa typing
-        miss = (
+        miss = [
             missing_method.execute(da, resample_freq, src_freq, options, indexer)
             for da in in_data
             if "time" in da.coords
-        )
+        ]
         # Reduce by or and broadcast to ensure the same length in time
         # When indexing is used and there are no valid points in the last period,
         # mask will not include it
-        mask = reduce(np.logical_or, miss)  # noqa typing
+        if len(miss) == 1:
+            mask = miss[0]
+        else:
+            # A single stacked any-reduction instead of pairwise logical_or.
+            mask = xr.concat(miss, dim="_missing_var").any(dim="_missing_var")
         if isinstance(mask, DataArray) and mask.time.size < out_data.time.size:
             mask = mask.reindex(time=out_data.time, fill_value=True)
         return out_data.where(~mask)
@@ -251,9 +263,6 @@ class GenericIndicator(ResamplingIndicator):
     def __call__(self, config: IndexConfig) -> DataArray:
         src_freq = config.climate_variables[0].source_frequency
         base_jinja_scope = {
-            "np": numpy,
-            "enumerate": enumerate,
-            "len": len,
             "output_freq": config.frequency,
             "source_freq": src_freq,
         }
@@ -317,14 +326,15 @@ def count_occurrences(
     to_percent: bool,
     **kwargs,  # noqa
 ) -> DataArray:
-    if date_event:
-        reducer_op = _count_occurrences_with_date
-    else:
-        reducer_op = partial(DataArray.sum, dim="time")
     merged_exceedances = _compute_exceedances(
         climate_vars, resample_freq.pandas_freq, logical_link
     )
-    result = reducer_op(merged_exceedances.resample(time=resample_freq.pandas_freq))
+    if date_event:
+        result = _count_occurrences_with_date(
+            merged_exceedances.resample(time=resample_freq.pandas_freq)
+        )
+    else:
+        result = _fused_resample_sum(merged_exceedances, resample_freq.pandas_freq)
     if to_percent:
         result = _to_percent(result, resample_freq)
         result.attrs[UNITS_KEY] = "%"
@@ -490,9 +500,13 @@ def standard_deviation(
     resample_freq: Frequency,
     **kwargs,  # noqa
 ) -> DataArray:
-    return _run_simple_reducer(
-        climate_vars, resample_freq, DataArrayResample.std, date_event=False
-    )
+    # flox computes the variance with the cancellation-prone E[x²]-E[x]²
+    # formula, which is too inaccurate for near-constant data such as
+    # temperatures in Kelvin.
+    with xr.set_options(use_flox=False):
+        return _run_simple_reducer(
+            climate_vars, resample_freq, DataArrayResample.std, date_event=False
+        )
 
 
 def max_of_rolling_sum(
@@ -965,6 +979,7 @@ def _run_simple_reducer(
             reducer=reducer_op,
         )
     else:
+        filtered_study = _align_time_chunks(filtered_study, resample_freq.pandas_freq)
         return reducer_op(
             filtered_study.resample(time=resample_freq.pandas_freq), dim="time"
         )
@@ -984,6 +999,8 @@ def _compute_exceedances(
         ).squeeze()
         for climate_var in climate_vars
     ]
+    if len(exceedances) == 1:
+        return exceedances[0]
     return logical_link(exceedances)
 
 
@@ -1025,15 +1042,19 @@ def _must_run_bootstrap(da: DataArray, threshold: Threshold | None) -> bool:
 def _get_ref_period_slice(da: DataArray) -> slice:
     if (bds := da.attrs.get("climatology_bounds", None)) is not None:
         return slice(*bds)
-    time_length = len(da.time)
-    return slice(*da.time[0 :: time_length - 1].dt.strftime("%Y-%m-%d").values)
+    # Formatting through the index avoids a DataArray-level strftime operation
+    # for just two values.
+    time_index = da.indexes.get("time")
+    return slice(
+        time_index[0].strftime("%Y-%m-%d"), time_index[-1].strftime("%Y-%m-%d")
+    )
 
 
 def _same_freq_for_all(climate_vars: list[ClimateVariable]) -> bool:
     if len(climate_vars) == 1:
         return True
-    freqs = list(map(lambda a: xr.infer_freq(a.studied_data.time), climate_vars))
-    return all(map(lambda x: x == freqs[0], freqs[1:]))
+    freqs = [xr.infer_freq(cv.studied_data.time) for cv in climate_vars]
+    return all(freq == freqs[0] for freq in freqs[1:])
 
 
 def _get_climate_vars_metadata(
@@ -1053,6 +1074,145 @@ def _get_climate_vars_metadata(
     ]
 
 
+def _resample_sum_block(block: DataArray, freq: str) -> DataArray:
+    return block.resample(time=freq).sum(dim="time")
+
+
+def _count_occurrences_block(
+    block: DataArray,
+    period_start_times: np.ndarray,
+    period_labels: np.ndarray,
+) -> DataArray:
+    """Count exceedances per period within one dask block.
+
+    The block is guaranteed by `_fused_resample_sum` to start on a period
+    boundary and to contain only whole periods, so the per-period counts
+    reduce to a single `np.add.reduceat` over the time axis, without
+    rebuilding a resampler for every block.
+    """
+    block_times = block.time.values
+    first = np.searchsorted(period_start_times, block_times[0], side="right") - 1
+    last = np.searchsorted(period_start_times, block_times[-1], side="right")
+    offsets = np.searchsorted(
+        block_times, period_start_times[first:last], side="left"
+    )
+    counts = np.add.reduceat(
+        block.values, offsets, axis=block.get_axis_num("time"), dtype=np.int64
+    )
+    coords = {
+        coord: block[coord]
+        for coord in block.coords
+        if "time" not in block[coord].dims
+    }
+    coords["time"] = period_labels[first:last]
+    return DataArray(data=counts, dims=block.dims, coords=coords, attrs=block.attrs)
+
+
+def _period_lengths(resampled: DataArrayResample, n_time: int) -> list[int] | None:
+    """Lengths of each resample period, or None when periods are not
+    non-empty, in-order, contiguous slices of the time axis.
+    """
+    period_lengths: list[int] = []
+    expected_start = 0
+    for period_slice in resampled.groups.values():
+        if not isinstance(period_slice, slice) or period_slice.step is not None:
+            return None
+        start = 0 if period_slice.start is None else period_slice.start
+        stop = n_time if period_slice.stop is None else period_slice.stop
+        if stop <= start or start != expected_start:
+            return None
+        expected_start = stop
+        period_lengths.append(stop - start)
+    if expected_start != n_time:
+        return None
+    return period_lengths
+
+
+def _period_aligned_chunks(
+    period_lengths: list[int], target_chunk_size: int
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Group whole periods into time chunks of roughly `target_chunk_size`.
+
+    Returns the time chunk sizes and the number of periods in each chunk.
+    """
+    time_chunks: list[int] = []
+    periods_per_chunk: list[int] = []
+    for period_length in period_lengths:
+        if time_chunks and time_chunks[-1] + period_length <= target_chunk_size:
+            time_chunks[-1] += period_length
+            periods_per_chunk[-1] += 1
+        else:
+            time_chunks.append(period_length)
+            periods_per_chunk.append(1)
+    return tuple(time_chunks), tuple(periods_per_chunk)
+
+
+def _align_time_chunks(da: DataArray, freq: str) -> DataArray:
+    """Rechunk `da` so every chunk holds whole resample periods.
+
+    Resample bins straddling chunk boundaries force dask into a cross-chunk
+    shuffle; aligning the time chunks on period boundaries keeps the
+    reduction blockwise. No-op for numpy-backed data and for layouts where
+    the alignment cannot be computed.
+    """
+    if da.chunks is None or "time" not in da.dims:
+        return da
+    period_lengths = _period_lengths(da.resample(time=freq), da.sizes["time"])
+    if period_lengths is None:
+        return da
+    time_chunks, _ = _period_aligned_chunks(
+        period_lengths, max(da.chunks[da.get_axis_num("time")])
+    )
+    return da.chunk({"time": time_chunks})
+
+
+def _fused_resample_sum(da: DataArray, freq: str) -> DataArray:
+    """Resample-sum `da` over time with a single blockwise pass when possible.
+
+    When `da` is dask backed, the time dimension is rechunked on resample
+    period boundaries so that every chunk holds whole periods. The sum then
+    runs once per chunk through `map_blocks` instead of going through the
+    task-heavy generic resample machinery, which avoids the cross-chunk
+    shuffle entirely.
+    Any layout where the per-block computation could diverge from the global
+    one (unsorted time, empty periods) falls back to a plain resample-sum.
+    """
+    resampled = da.resample(time=freq)
+    period_lengths = _period_lengths(resampled, da.sizes["time"])
+    if period_lengths is None:
+        return resampled.sum(dim="time")
+    period_starts = np.cumsum([0] + period_lengths[:-1])
+    if da.chunks is None:
+        if da.dtype == bool:
+            # Numpy-backed exceedances take the same reduceat kernel as the
+            # per-block dask path, only over the whole time axis at once.
+            return _count_occurrences_block(
+                da,
+                period_start_times=da.time.values[period_starts],
+                period_labels=np.array(list(resampled.groups.keys())),
+            )
+        return resampled.sum(dim="time")
+    time_chunks, periods_per_chunk = _period_aligned_chunks(
+        period_lengths, max(da.chunks[da.get_axis_num("time")])
+    )
+    aligned = da.chunk({"time": time_chunks})
+    template = resampled.sum(dim="time").chunk({"time": periods_per_chunk})
+    if da.dtype == bool:
+        # Boolean exceedances are counted with a C-level reduceat kernel.
+        return xr.map_blocks(
+            _count_occurrences_block,
+            aligned,
+            kwargs={
+                "period_start_times": da.time.values[period_starts],
+                "period_labels": template.time.values,
+            },
+            template=template,
+        )
+    return xr.map_blocks(
+        _resample_sum_block, aligned, kwargs={"freq": freq}, template=template
+    )
+
+
 def _reduce_with_date_event(
     resampled: DataArrayResample,
     reducer: Callable[[DataArrayResample], DataArray],
@@ -1232,6 +1392,14 @@ def _check_data(climate_vars: list[ClimateVariable], src_freq: str):
     if src_freq is None:
         return
     for climate_var in climate_vars:
+        if (
+            climate_var.is_inferred_frequency
+            and climate_var.source_frequency.pandas_freq == src_freq
+        ):
+            # The frequency was already inferred from this very time axis when
+            # the variable was parsed; re-running the strict check would only
+            # redo that inference.
+            continue
         da = climate_var.studied_data
         if "time" in da.coords and da.time.ndim == 1 and len(da.time) > 3:
             check_freq(da, src_freq, strict=True)
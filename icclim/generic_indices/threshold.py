@@ -438,7 +438,14 @@ class PercentileThreshold(Threshold):
     @unit.setter
     def unit(self, unit: str | xr.DataArray | pint.Quantity | pint.Unit):
         if self.is_ready:
-            if self.value.attrs.get(UNITS_KEY, None) is not None and unit is not None:
+            if (
+                self.value.attrs.get(UNITS_KEY, None) is not None
+                and unit is not None
+                and unit != self.value.attrs[UNITS_KEY]
+            ):
+                # Skip the pint conversion when the unit is already the target
+                # one, which is the common case of thresholds built in the
+                # data unit.
                 self._prepared_value = convert_units_to(self._prepared_value, unit)
             self.value.attrs[UNITS_KEY] = unit
 
@@ -490,7 +497,6 @@ class PercentileThreshold(Threshold):
             if not isinstance(value, list):
                 value = [value]
             self._initial_value = [float(x) for x in value]
-            self.unit = unit
         self.operator = operator
         self.threshold_var_name = threshold_var_name
         self.initial_query = initial_query
@@ -526,6 +532,11 @@ class PercentileThreshold(Threshold):
             raise NotImplementedError(
                 f"Unknown percentile unit" f" '{self._initial_unit}'."
             )
+        if np.issubdtype(studied_data.dtype, np.floating):
+            # Percentiles are computed in float64; carrying them at the study
+            # data's own precision halves the memory traffic of the
+            # comparisons on float32 inputs, and is a no-op on float64.
+            prepared_data = prepared_data.astype(studied_data.dtype, copy=False)
         self._prepared_value = prepared_data.chunk("auto")
         self.is_ready = True
 
@@ -644,7 +655,11 @@ class BasicThreshold(Threshold):
 
     @unit.setter
     def unit(self, unit):
-        if self.value.attrs.get(UNITS_KEY, None) is not None and unit is not None:
+        if (
+            self.value.attrs.get(UNITS_KEY, None) is not None
+            and unit is not None
+            and unit != self.value.attrs[UNITS_KEY]
+        ):
             self.value = convert_units_to(self.value, unit)
         self.value.attrs[UNITS_KEY] = unit
 
@@ -689,10 +704,9 @@ class BasicThreshold(Threshold):
             )
         else:
             raise NotImplementedError(f"Cannot build threshold from a {type(value)}.")
-        if unit is not None:
-            built_value = convert_units_to(built_value, unit)
         self.operator = operator
         self.value = built_value
+        # The `unit` setter does the pint conversion, no need to pre-convert.
         self.unit = unit
         self.is_ready = True
         self.threshold_var_name = threshold_var_name
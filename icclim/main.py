@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import time
 from datetime import datetime
-from functools import partial, reduce
+from functools import partial
 from typing import Callable, Literal, Sequence
 from warnings import warn
 
@@ -56,6 +56,7 @@ from icclim.models.quantile_interpolation import (
 from icclim.models.standard_index import StandardIndex
 from icclim.models.user_index_dict import UserIndexDict
 from icclim.pre_processing.in_file_dictionary import InFileDictionary
+from icclim.pre_processing.input_parsing import is_dataset_path, read_dataset
 from icclim.user_indices.calc_operation import CalcOperationRegistry
 from icclim.utils import read_date
 
@@ -106,10 +107,22 @@ def indices(
     if "out_file" in kwargs.keys():
         out = kwargs["out_file"]
         del kwargs["out_file"]
+    if is_dataset_path(kwargs.get("in_files", None)):
+        # Open the storage once for the whole group instead of once per index.
+        kwargs["in_files"] = read_dataset(kwargs["in_files"])
+    split_progress = (
+        "callback_percentage_start_value" not in kwargs
+        and "callback_percentage_total" not in kwargs
+    )
     acc = []
-    for i in indices:
+    for i_index, i in enumerate(indices):
         log.info(f"Computing index '{i.short_name}'")
         kwargs["index_name"] = i.short_name
+        if split_progress:
+            # Give each index its share of the progress scale so the batch
+            # reports a single monotonic 0 to 100 instead of N resets.
+            kwargs["callback_percentage_start_value"] = i_index * 100 // len(indices)
+            kwargs["callback_percentage_total"] = (i_index + 1) * 100 // len(indices)
         if ignore_error:
             try:
                 res = index(**kwargs)
@@ -170,8 +183,7 @@ def _get_indices_of_group(
     # -- Look for index group (e.g. index_group='HEAT')
     groups = [IndexGroupRegistry.lookup(i, no_error=True) for i in query]
     groups = list(filter(lambda x: x is not None, groups))
-    indices = map(lambda x: x.get_indices(), groups)
-    indices = reduce(lambda x, y: x + y, indices, [])  # flatten list[list]
+    indices = [i for group in groups for i in group.get_indices()]
     if len(indices) >= len(query):
         return indices
     raise InvalidIcclimArgumentError(f"The index group {query} was not recognized.")
@@ -528,13 +540,19 @@ def _handle_deprecated_params(
     return index_name, user_index, save_thresholds, doy_window_width
 
 
+_options_already_set = False
+
+
 def _setup(callback, callback_start_value, logs_verbosity):
-    # make xclim input daily check a warning instead of an error
-    # TODO: it might be safer to feed a context manager which will setup
-    #       and teardown these confs
-    xclim.set_options(data_validation="warn")
-    # keep attributes through xarray operations
-    xr.set_options(keep_attrs=True)
+    global _options_already_set
+    if not _options_already_set:
+        # make xclim input daily check a warning instead of an error
+        # TODO: it might be safer to feed a context manager which will setup
+        #       and teardown these confs
+        xclim.set_options(data_validation="warn")
+        # keep attributes through xarray operations
+        xr.set_options(keep_attrs=True)
+        _options_already_set = True
     log.set_verbosity(logs_verbosity)
     log.start_message()
     callback(callback_start_value)
@@ -583,21 +601,25 @@ def _compute_climate_index(
         )
     history = _build_history(result_da, config, initial_history, climate_index)
     result_ds = _add_ecad_index_metadata(
-        result_ds, climate_index, history, initial_source, reference
+        result_ds,
+        result_da.attrs.get("standard_name", climate_index.standard_name),
+        history,
+        initial_source,
+        reference,
     )
     return result_ds
 
 
 def _add_ecad_index_metadata(
     result_ds: Dataset,
-    computed_index: Indicator,
+    title: str,
     history: str,
     initial_source: str,
     reference: str,
 ) -> Dataset:
     result_ds.attrs.update(
         dict(
-            title=computed_index.standard_name,
+            title=title,
             references=reference,
             institution="Climate impact portal (https://climate4impact.eu)",
             history=history,
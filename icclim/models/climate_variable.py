@@ -6,6 +6,7 @@ from typing import Any, Sequence
 import jinja2
 import xarray
 from xarray.core.dataarray import DataArray
+from xarray.core.dataset import Dataset
 
 from icclim.generic_indices.standard_variable import StandardVariable
 from icclim.generic_indices.threshold import (
@@ -24,10 +25,12 @@ from icclim.pre_processing.input_parsing import (
     DEFAULT_INPUT_FREQUENCY,
     build_reference_da,
     build_studied_data,
+    check_time_range_pre_validity,
     guess_input_type,
     guess_var_names,
     read_dataset,
 )
+from icclim.utils import get_date_to_iso_format
 
 
 @dataclass
@@ -46,6 +49,9 @@ class ClimateVariable:
         The variable studied.
     threshold: Threshold | None
         thresholds for this variable
+    is_inferred_frequency: bool
+        True when `source_frequency` was inferred from the data time axis,
+        False when it comes from the default input frequency.
     """
 
     name: str
@@ -55,6 +61,7 @@ class ClimateVariable:
     source_frequency: Frequency
     threshold: Threshold | None = None
     is_reference: bool = False
+    is_inferred_frequency: bool = False
 
     def build_indicator_metadata(
         self,
@@ -105,7 +112,13 @@ def build_climate_vars(
             f" Please provide them with an xarray.Dataset, netCDF file(s) or a"
             f" zarr store."
         )
+    if time_range is not None:
+        # Validate and normalize the bounds once instead of once per variable.
+        check_time_range_pre_validity("time_range", time_range)
+        time_range = [get_date_to_iso_format(x) for x in time_range]
     acc = []
+    # Several variables may point to the same file, open each file only once.
+    study_ds_cache: dict[str, Dataset] = {}
     for i, raw_climate_var in enumerate(climate_vars_dict.items()):
         if standard_index is not None:
             standard_var = standard_index.input_variables[i]
@@ -118,6 +131,7 @@ def build_climate_vars(
                 ignore_Feb29th,
                 time_range,
                 standard_var=standard_var,
+                study_ds_cache=study_ds_cache,
             )
         )
     if _standard_index_needs_ref(
@@ -178,6 +192,7 @@ def _build_reference_variable(
         only_leap_years=False,
         percentile_min_value=None,
     )
+    inferred_freq = xarray.infer_freq(studied_data.time)
     return ClimateVariable(
         name=var_name + "_reference",
         standard_var=standard_var,
@@ -189,9 +204,10 @@ def _build_reference_variable(
             "time_encoding": study_ds.time.encoding,
         },
         source_frequency=FrequencyRegistry.lookup(
-            xarray.infer_freq(studied_data.time) or DEFAULT_INPUT_FREQUENCY
+            inferred_freq or DEFAULT_INPUT_FREQUENCY
         ),
         is_reference=True,
+        is_inferred_frequency=inferred_freq is not None,
     )
 
 
@@ -269,17 +285,20 @@ def _build_climate_var(
     ignore_Feb29th: bool,
     time_range: Sequence[str],
     standard_var: StandardVariable | None,
+    study_ds_cache: dict[str, Dataset] | None = None,
 ) -> ClimateVariable:
     if isinstance(climate_var_data, dict):
-        study_ds = read_dataset(
-            climate_var_data["study"], standard_var, climate_var_name
+        study_ds = _read_study_input(
+            climate_var_data["study"], standard_var, climate_var_name, study_ds_cache
         )
         # todo: deprecate climate_var_data.get("per_var_name", None)
         #       for threshold_var_name
         climate_var_thresh = climate_var_data.get("thresholds", None)
     else:
         climate_var_data: InFileBaseType
-        study_ds = read_dataset(climate_var_data, standard_var, climate_var_name)
+        study_ds = _read_study_input(
+            climate_var_data, standard_var, climate_var_name, study_ds_cache
+        )
         climate_var_thresh = None
     if standard_var is None:
         standard_var = guess_input_type(study_ds[climate_var_name])
@@ -295,6 +314,7 @@ def _build_climate_var(
             original_data=study_ds[climate_var_name],
             conversion_unit=studied_data.attrs[UNITS_KEY],
         )
+    inferred_freq = xarray.infer_freq(studied_data.time)
     return ClimateVariable(
         name=climate_var_name,
         standard_var=standard_var,
@@ -306,11 +326,30 @@ def _build_climate_var(
             "time_encoding": study_ds.time.encoding,
         },
         source_frequency=FrequencyRegistry.lookup(
-            xarray.infer_freq(studied_data.time) or DEFAULT_INPUT_FREQUENCY
+            inferred_freq or DEFAULT_INPUT_FREQUENCY
         ),
+        is_inferred_frequency=inferred_freq is not None,
     )
 
 
+def _read_study_input(
+    study_input: InFileBaseType,
+    standard_var: StandardVariable | None,
+    climate_var_name: str,
+    study_ds_cache: dict[str, Dataset] | None,
+) -> Dataset:
+    """Read `study_input`, reusing the dataset from `study_ds_cache` when the
+    same path was already opened for another climate variable.
+    """
+    if study_ds_cache is None or not isinstance(study_input, str):
+        return read_dataset(study_input, standard_var, climate_var_name)
+    if study_input not in study_ds_cache:
+        study_ds_cache[study_input] = read_dataset(
+            study_input, standard_var, climate_var_name
+        )
+    return study_ds_cache[study_input]
+
+
 def _build_threshold(
     climate_var_thresh: str | Threshold,
     original_data: DataArray,
@@ -343,11 +343,9 @@ def _get_end_date(
 
 
 def _get_frequency_from_string(query: str) -> Frequency:
-    for key, freq in FrequencyRegistry.catalog().items():
-        if key == query.upper() or query.upper() in map(
-            str.upper, freq.accepted_values
-        ):
-            return freq
+    freq = FrequencyRegistry._lookup_map().get(query.upper())
+    if freq is not None:
+        return freq
     # else assumes it's a pandas frequency (such as "W" or "3MS")
     try:
         to_offset(query)  # no-op, used to check if it's a valid pandas freq
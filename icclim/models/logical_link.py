@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import dataclasses
-from functools import reduce
 from typing import Callable
 
-import numpy as np
+import xarray as xr
 from xarray import DataArray
 
 from icclim.models.registry import Registry
 
 
+def _logical_or(data_list: list[DataArray]) -> DataArray:
+    if len(data_list) == 1:
+        return data_list[0]
+    # A single stacked reduction instead of pairwise np.logical_or calls,
+    # which would allocate a fresh intermediary array per pair.
+    return xr.concat(data_list, dim="_logical_link").any(dim="_logical_link")
+
+
+def _logical_and(data_list: list[DataArray]) -> DataArray:
+    if len(data_list) == 1:
+        return data_list[0]
+    return xr.concat(data_list, dim="_logical_link").all(dim="_logical_link")
+
+
 @dataclasses.dataclass
 class LogicalLink:
     name: str
@@ -30,12 +43,12 @@ class LogicalLinkRegistry(Registry[LogicalLink]):
         standard_name="OR",
         long_name="OR",
         short_name="OR",
-        compute=lambda data_list: reduce(np.logical_or, data_list),  # type:ignore
+        compute=_logical_or,
     )
     LOGICAL_AND = LogicalLink(
         name="and",
         standard_name="AND",
         long_name="AND",
         short_name="AND",
-        compute=lambda data_list: reduce(np.logical_and, data_list),  # type:ignore
+        compute=_logical_and,
     )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 from typing import Callable
 
+import numpy as np
 from xarray import DataArray
 
 from icclim.icclim_exceptions import InvalidIcclimArgumentError
@@ -43,7 +44,7 @@ class OperatorRegistry(Registry[Operator]):
         standard_name="greater_than",
         aliases=["gt", ">"],
         operand=">",
-        compute=lambda da, th: da > th,  # noqa
+        compute=np.greater,
     )
     LOWER = Operator(
         short_name="lt",
@@ -51,7 +52,7 @@ class OperatorRegistry(Registry[Operator]):
         standard_name="lower_than",
         aliases=["lt", "<"],
         operand="<",
-        compute=lambda da, th: da < th,  # noqa
+        compute=np.less,
     )
     GREATER_OR_EQUAL = Operator(
         short_name="get",
@@ -59,7 +60,7 @@ class OperatorRegistry(Registry[Operator]):
         standard_name="greater_or_equal_to",
         aliases=["get", "ge", ">=", "=>"],
         operand=">=",
-        compute=lambda da, th: da >= th,  # noqa
+        compute=np.greater_equal,
     )
     LOWER_OR_EQUAL = Operator(
         short_name="let",
@@ -67,7 +68,7 @@ class OperatorRegistry(Registry[Operator]):
         standard_name="lower_or_equal_to",
         aliases=["let", "le", "<=", "=<"],
         operand="<=",
-        compute=lambda da, th: da <= th,  # noqa
+        compute=np.less_equal,
     )
     EQUAL = Operator(
         short_name="e",
@@ -75,7 +76,7 @@ class OperatorRegistry(Registry[Operator]):
         standard_name="equal_to",
         aliases=["e", "equal", "eq", "=", "=="],
         operand="==",
-        compute=lambda da, th: da == th,  # noqa
+        compute=np.equal,
     )
     # A None operand means the threshold is reached and a reducer specific computation
     # is done. Case of excess and deficit (a.k.a gd4, hd17)
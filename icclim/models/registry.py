@@ -28,10 +28,9 @@ class Registry(Generic[T], ABC):
         if isinstance(query, cls._item_class):
             return query
         if isinstance(query, str):
-            q = query.upper()
-            for key, item in cls.catalog().items():
-                if q == key.upper() or q in cls.get_item_aliases(item):
-                    return deepcopy(item)
+            item = cls._lookup_map().get(query.upper())
+            if item is not None:
+                return deepcopy(item)
         if no_error:
             return None
         raise InvalidIcclimArgumentError(
@@ -39,6 +38,22 @@ class Registry(Generic[T], ABC):
             f"Use one of {cls.every_aliases()}."
         )
 
+    @classmethod
+    def _lookup_map(cls) -> dict[str, T]:
+        """Memoized mapping of every upper-cased key and alias to its item.
+
+        Built once per registry so that `lookup` is a single dict access
+        instead of a linear scan of the catalog.
+        """
+        if "_lookup_cache" not in cls.__dict__:
+            mapping: dict[str, T] = {}
+            for key, item in cls.catalog().items():
+                mapping.setdefault(key.upper(), item)
+                for alias in cls.get_item_aliases(item):
+                    mapping.setdefault(alias.upper(), item)
+            cls._lookup_cache = mapping
+        return cls._lookup_cache
+
     @classmethod
     def every_aliases(cls) -> list[T]:
         return list(map(cls.get_item_aliases, list(cls.catalog().values())))
@@ -56,11 +56,18 @@ def read_dataset(
         # we assumes it's a list of netCDF files
         #  join="override" is used for cases some dimension are a tiny bit different
         #  in different files (was the case with eobs).
-        ds = xr.open_mfdataset(in_files, parallel=True, join="override")  # noqa
+        #  chunks="auto" gives right-sized dask chunks instead of one chunk
+        #  per file, which keeps memory bounded on large multi-file datasets.
+        ds = xr.open_mfdataset(
+            in_files, parallel=True, join="override", chunks="auto"
+        )  # noqa
     elif is_netcdf_path(in_files):
         ds = xr.open_dataset(in_files)
     elif is_zarr_path(in_files):
-        ds = xr.open_zarr(in_files)
+        # `chunks="auto"` merges the on-disk chunks into dask-sized chunks
+        # while keeping them aligned on multiples of the store's chunking,
+        # where `open_zarr` would map one dask chunk per on-disk chunk.
+        ds = xr.open_dataset(in_files, engine="zarr", chunks="auto")
     elif isinstance(in_files, (list, tuple)):
         return xr.merge(
             [
@@ -221,13 +228,19 @@ def build_studied_data(
             )
     else:
         da = original_da
-    if ignore_Feb29th:
+    calendar = xclim.core.calendar.get_calendar(da)
+    if ignore_Feb29th and calendar not in CfCalendarRegistry.NO_LEAP.aliases:
+        # noleap data is left untouched, the conversion would only rebuild an
+        # identical time index per variable.
         da = xclim.core.calendar.convert_calendar(da, CfCalendarRegistry.NO_LEAP.name)
     if da.attrs.get(UNITS_KEY, None) is None and standard_var is not None:
         da.attrs[UNITS_KEY] = standard_var.default_units
     if is_precipitation_amount(da):
         da = xclim.core.units.amount2rate(da)
-    da = da.chunk("auto")
+    if da.chunks is None:
+        # Already chunked data keeps its layout, re-chunking it to "auto"
+        # would only add a graph layer (and discard deliberate user chunking).
+        da = da.chunk("auto")
     return da
 
 
@@ -274,15 +287,15 @@ def is_dataset_path(query: Sequence | str) -> bool:
 
 
 def reduce_only_leap_years(da: DataArray) -> DataArray:
-    reduced_list = []
-    for _, val in da.groupby(da.time.dt.year):
-        if val.time.dt.dayofyear.max() == 366:
-            reduced_list.append(val)
-    if not reduced_list:
+    # Leap years are the ones owning a 366th day of year. A boolean mask over
+    # the time index replaces the per-year groupby and the concat copy.
+    years = da.time.dt.year.values
+    leap_years = np.unique(years[da.time.dt.dayofyear.values == 366])
+    if len(leap_years) == 0:
         raise InvalidIcclimArgumentError(
             "No leap year in current dataset. Do not use `only_leap_years` parameter."
         )
-    return xr.concat(reduced_list, "time")
+    return da.isel(time=np.isin(years, leap_years))
 
 
 def read_threshold_DataArray(
@@ -118,6 +118,15 @@ class Test_Integration:
         assert f"icclim version: {ICCLIM_VERSION}" in res.attrs["history"]
         assert res.SU.isel(time=0) == 26  # January
 
+    def test_index_SU__dask_chunked(self):
+        tas = stub_tas(tas_value=26 + K2C)
+        tas[:5] = 0
+        expected = icclim.index(index_name="SU", in_files=tas, slice_mode="ms")
+        res = icclim.index(
+            index_name="SU", in_files=tas.chunk({"time": 100}), slice_mode="ms"
+        )
+        xr.testing.assert_equal(expected.SU, res.SU.compute())
+
     def test_index_SU__on_dataset(self):
         res = icclim.index(
             index_name="SU",
@@ -440,7 +449,7 @@ class Test_Integration:
             ignore_error=True,
             slice_mode="DJF",
             base_period_time_range=("2042-01-01", "2042-12-31"),
-        ).compute()
+        ).load()
         for i in EcadIndexRegistry.values():
             # No variable in input to compute snow indices
             if i.group == IndexGroupRegistry.SNOW:
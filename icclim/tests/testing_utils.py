@@ -8,10 +8,14 @@ import xarray as xr
 from icclim.models.constants import UNITS_KEY
 
 VALUE_COUNT = 365 * 5 + 1  # 5 years of data (with 1 leap year)
+# Coordinates are wrapped in Variables once so that every stub reuses them
+# as-is instead of rebuilding and revalidating them per DataArray.
 COORDS = dict(
-    lat=[42],
-    lon=[42],
-    time=pd.date_range("2042-01-01", periods=VALUE_COUNT, freq="D"),
+    lat=xr.Variable(("lat",), [42]),
+    lon=xr.Variable(("lon",), [42]),
+    time=xr.Variable(
+        ("time",), pd.date_range("2042-01-01", periods=VALUE_COUNT, freq="D")
+    ),
 )
 K2C = 273.15
 
@@ -28,7 +32,7 @@ def stub_tas(tas_value: float = 1.0, use_dask=False, use_cftime=False):
     if use_cftime:
         da["time"] = CF_TIME_RANGE
     if use_dask:
-        da.chunk()
+        da = da.chunk()
     return da
 
 
@@ -41,5 +45,5 @@ def stub_pr(value: float, use_dask=False):
         attrs={UNITS_KEY: "kg m-2 d-1"},
     )
     if use_dask:
-        da.chunk()
+        da = da.chunk()
     return da
@@ -3,8 +3,11 @@ from __future__ import annotations
 import re
 import warnings
 from datetime import datetime
+from functools import lru_cache
 
 import dateparser
+import numpy as np
+import pandas as pd
 import pint
 import xarray as xr
 import xclim
@@ -14,10 +17,14 @@ from icclim.icclim_exceptions import InvalidIcclimArgumentError
 PR_AMOUNT_STANDARD_NAME = "thickness_of_rainfall_amount"
 
 
-def read_date(in_date: str | datetime) -> datetime:
+def read_date(in_date: str | datetime | np.datetime64) -> datetime:
     if isinstance(in_date, datetime):
         return in_date
-    date = dateparser.parse(in_date)
+    if isinstance(in_date, np.datetime64):
+        # Accept raw time axis values (e.g. `da.time.values[0]`) so that
+        # callers don't need to box them into python datetimes first.
+        return pd.Timestamp(in_date).to_pydatetime()
+    date = _parse_date(in_date)
     if date is None:
         raise InvalidIcclimArgumentError(
             f"The date {in_date} does not have a valid format."
@@ -27,7 +34,9 @@ def read_date(in_date: str | datetime) -> datetime:
     return date
 
 
-def get_date_to_iso_format(in_date: str | datetime) -> str:
+def get_date_to_iso_format(in_date: str | datetime | np.datetime64) -> str:
+    if isinstance(in_date, np.datetime64):
+        in_date = read_date(in_date)
     if isinstance(in_date, str):
         if re.match(r"^\d{4}$", in_date):
             warnings.warn(f"{in_date} is transformed into {in_date}-01-01")
@@ -39,6 +48,13 @@ def get_date_to_iso_format(in_date: str | datetime) -> str:
     return in_date.strftime("%Y-%m-%d")
 
 
+@lru_cache(maxsize=None)
+def _parse_date(in_date: str) -> datetime | None:
+    # dateparser is slow and the same bounds are parsed once per climate
+    # variable, hence the memoization.
+    return dateparser.parse(in_date)
+
+
 def is_number_sequence(values) -> bool:
     return isinstance(values, (tuple, list)) and all(
         map(lambda x: isinstance(x, (float, int)), values)
@@ -3,16 +3,17 @@
 from setuptools import find_packages, setup
 
 MINIMAL_REQUIREMENTS = [
-    "numpy>=1.16",
+    "numpy>=1.20",
     "xarray>=2022.6",
     "xclim>=0.39",
     "cf_xarray>=0.7.4",
-    "cftime>=1.4.1",
+    "cftime>=1.6.2",
     "dask[array]",
+    "bottleneck>=1.3.5",
+    "flox>=0.7",
     "netCDF4>=1.5.7",
-    "pyyaml",
     "psutil",
-    "zarr",
+    "zarr>=2.13",
     "rechunker>=0.3, !=0.4",
     "fsspec",
     "pandas>=1.3",